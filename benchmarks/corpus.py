@@ -0,0 +1,335 @@
+"""벤치마크용 합성 한국어 뉴스 코퍼스 생성기
+
+빅카인즈(BigKinds) 내보내기 파일과 같은 컬럼 구성을 가진 CSV/XLSX 파일을 만든다.
+전체 기사 중 일부는 같은 사건을 다룬 유사 기사 묶음(클러스터)으로 심어 두어
+이슈 추출 단계가 실제와 비슷한 부하를 받도록 한다. 같은 시드와 크기로
+생성하면 항상 같은 파일이 만들어진다.
+
+사용 예:
+    python -m benchmarks.corpus --size 10000 --output-dir bench_data
+    python -m benchmarks.corpus --size 1000 --format csv xlsx
+"""
+import argparse
+import json
+import os
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+# 빅카인즈 내보내기 컬럼 (순서 포함)
+BIGKINDS_COLUMNS = [
+    '뉴스 식별자',
+    '일자',
+    '언론사',
+    '기고자',
+    '제목',
+    '통합 분류1',
+    '통합 분류2',
+    '통합 분류3',
+    '사건/사고 분류1',
+    '사건/사고 분류2',
+    '사건/사고 분류3',
+    '인물',
+    '위치',
+    '기관',
+    '키워드',
+    '특성추출(가중치순 상위 50개)',
+    '본문',
+    'URL',
+    '분석제외 여부',
+]
+
+# 언론사 이름과 8자리 언론사 코드
+MEDIA = [
+    ('경향신문', '01100101'),
+    ('국민일보', '01100201'),
+    ('동아일보', '01100401'),
+    ('문화일보', '01100501'),
+    ('서울신문', '01100611'),
+    ('세계일보', '01100701'),
+    ('조선일보', '01100801'),
+    ('중앙일보', '01100901'),
+    ('한겨레', '01101001'),
+    ('한국일보', '01101101'),
+    ('매일경제', '02100101'),
+    ('한국경제', '02100601'),
+    ('KBS', '08100101'),
+    ('MBC', '08100201'),
+    ('SBS', '08100301'),
+]
+
+CATEGORIES = {
+    '정치': ['정치>국회_정당', '정치>선거', '정치>외교', '정치>북한', '정치>행정_자치', '정치>정치일반'],
+    '경제': ['경제>부동산', '경제>증권_증시', '경제>반도체', '경제>금융_재테크', '경제>산업_기업', '경제>경제일반'],
+    '사회': ['사회>사건_사고', '사회>교육_시험', '사회>노동_복지', '사회>의료_건강', '사회>환경', '사회>사회일반'],
+}
+
+TOPIC_NOUNS = {
+    '정치': ['국회', '정당', '의원', '선거', '공천', '대통령', '여당', '야당', '법안', '예산안',
+             '외교', '정상회담', '북한', '미사일', '국정감사', '개헌', '총선', '지지율', '탄핵', '대변인'],
+    '경제': ['금리', '물가', '환율', '수출', '반도체', '주가', '코스피', '부동산', '아파트', '대출',
+             '은행', '투자', '기업', '실적', '매출', '성장률', '무역', '배터리', '전기차', '고용'],
+    '사회': ['경찰', '사고', '화재', '수사', '법원', '재판', '학교', '학생', '교사', '병원',
+             '의사', '환자', '노동자', '임금', '파업', '복지', '미세먼지', '폭우', '지진', '시민'],
+}
+
+COMMON_NOUNS = [
+    '정부', '정책', '발표', '관계자', '전문가', '계획', '문제', '상황', '지역', '국민',
+    '회의', '결과', '영향', '방안', '조사', '협의', '대응', '논란', '입장', '기자',
+    '오늘', '올해', '지난해', '서울', '부산', '발언', '주장', '비판', '지원', '제도',
+]
+
+PARTICLES = ['은', '는', '이', '가', '을', '를', '에서', '의', '와', '과', '로', '에']
+
+VERBS = ['밝혔다', '말했다', '전했다', '강조했다', '지적했다', '설명했다', '나타났다', '예정이다', '결정했다', '논의했다']
+
+PEOPLE = ['윤석열', '이재명', '한동훈', '조국', '이준석', '김건희', '추경호', '홍익표', '이창용', '최상목',
+          '김동연', '오세훈', '박형준', '안철수', '김기현', '정진석', '박민식', '이상민', '한덕수', '조태용']
+
+LOCATIONS = ['서울', '부산', '대구', '인천', '광주', '대전', '울산', '세종', '경기', '강원',
+             '충북', '충남', '전북', '전남', '경북', '경남', '제주', '여의도', '용산', '평양']
+
+ORGANIZATIONS = ['국회', '대통령실', '국민의힘', '더불어민주당', '기획재정부', '한국은행', '금융위원회', '검찰',
+                 '대법원', '헌법재판소', '교육부', '보건복지부', '고용노동부', '삼성전자', 'SK하이닉스',
+                 '현대자동차', 'LG에너지솔루션', '경찰청', '소방청', '환경부']
+
+class CorpusGenerator:
+    """빅카인즈 형식의 합성 뉴스 기사 생성 클래스
+
+    Args:
+        size (int): 생성할 기사 수
+        seed (int): 난수 시드
+        start_date (date): 기사 시작 날짜
+        days (int): 기사가 분포할 일 수
+        cluster_ratio (float): 유사 기사 클러스터에 속하는 기사 비율
+        cluster_size (int): 클러스터 하나의 평균 기사 수
+        content_words (int): 본문 어절 수
+    """
+
+    def __init__(self, size, seed=42, start_date=date(2024, 1, 1), days=31,
+                 cluster_ratio=0.3, cluster_size=20, content_words=80):
+        self.size = size
+        self.seed = seed
+        self.start_date = start_date
+        self.days = days
+        self.cluster_ratio = cluster_ratio
+        self.cluster_size = cluster_size
+        self.content_words = content_words
+
+        rng = np.random.default_rng(seed)
+        self.clusters = self._plant_clusters(rng)
+
+    def _plant_clusters(self, rng):
+        """클러스터(같은 사건을 다룬 기사 묶음) 구성
+
+        Returns:
+            dict: {기사 인덱스: 클러스터 정보} (클러스터에 속하지 않은 기사는 없음)
+        """
+        n_clustered = int(self.size * self.cluster_ratio)
+        n_clusters = max(1, n_clustered // max(1, self.cluster_size)) if n_clustered else 0
+
+        assignments = {}
+        if not n_clusters:
+            return assignments
+
+        members = rng.choice(self.size, size=n_clustered, replace=False)
+        labels = rng.integers(0, n_clusters, size=n_clustered)
+
+        stories = []
+        for cluster_id in range(n_clusters):
+            topic = list(CATEGORIES)[cluster_id % len(CATEGORIES)]
+            nouns = rng.choice(TOPIC_NOUNS[topic], size=6, replace=False).tolist()
+            stories.append({
+                'cluster_id': cluster_id,
+                'topic': topic,
+                'category': CATEGORIES[topic][int(rng.integers(len(CATEGORIES[topic])))],
+                'nouns': nouns,
+                'person': PEOPLE[int(rng.integers(len(PEOPLE)))],
+                'organization': ORGANIZATIONS[int(rng.integers(len(ORGANIZATIONS)))],
+                'day': int(rng.integers(self.days)),
+                'title': f"{nouns[0]} {nouns[1]} 논란… {nouns[2]} {VERBS[int(rng.integers(len(VERBS)))]}",
+            })
+
+        for index, label in zip(members.tolist(), labels.tolist()):
+            assignments[index] = stories[label]
+        return assignments
+
+    def _sentence(self, rng, nouns):
+        """명사 목록으로 조사와 서술어가 붙은 문장 생성"""
+        words = [f"{noun}{PARTICLES[int(rng.integers(len(PARTICLES)))]}" for noun in nouns]
+        return ' '.join(words) + f" {VERBS[int(rng.integers(len(VERBS)))]}."
+
+    def _content(self, rng, topic_nouns, story=None):
+        """본문 생성 (클러스터 기사는 사건 핵심어를 반복적으로 포함)
+
+        Returns:
+            tuple: (본문, 본문에 사용된 명사 리스트)
+        """
+        sentences = []
+        used_nouns = []
+        n_words = 0
+        while n_words < self.content_words:
+            length = int(rng.integers(4, 9))
+            if story is not None and rng.random() < 0.6:
+                nouns = rng.choice(story['nouns'], size=min(length, len(story['nouns'])), replace=False).tolist()
+                nouns.append(COMMON_NOUNS[int(rng.integers(len(COMMON_NOUNS)))])
+            else:
+                pool = topic_nouns if rng.random() < 0.5 else COMMON_NOUNS
+                nouns = [pool[int(i)] for i in rng.integers(len(pool), size=length)]
+            sentences.append(self._sentence(rng, nouns))
+            used_nouns.extend(nouns)
+            n_words += len(nouns) + 1
+        return ' '.join(sentences), used_nouns
+
+    def _news_id(self, media_code, article_date, index):
+        """'언론사코드.YYYYMMDDHHmmSSnnn' 형식의 고유 식별자 생성"""
+        seconds = (index // 1000) % 86400
+        hhmmss = f"{seconds // 3600:02d}{(seconds // 60) % 60:02d}{seconds % 60:02d}"
+        return f"{media_code}.{article_date:%Y%m%d}{hhmmss}{index % 1000:03d}"
+
+    def make_frame(self, start=0, count=None, id_noise=0.0):
+        """기사 범위 [start, start + count)를 DataFrame으로 생성
+
+        Args:
+            start (int): 시작 기사 인덱스
+            count (int): 생성할 기사 수 (기본: 나머지 전체)
+            id_noise (float): 날짜만 있거나 잘못된 형식의 뉴스 식별자 비율
+
+        Returns:
+            pd.DataFrame: 빅카인즈 컬럼을 가진 데이터프레임
+        """
+        if count is None:
+            count = self.size - start
+        count = max(0, min(count, self.size - start))
+
+        # 같은 범위는 항상 같은 내용이 되도록 범위 시작점으로 시드 분기
+        rng = np.random.default_rng([self.seed, start])
+
+        rows = []
+        for index in range(start, start + count):
+            story = self.clusters.get(index)
+            media_name, media_code = MEDIA[int(rng.integers(len(MEDIA)))]
+
+            if story is not None:
+                topic = story['topic']
+                category = story['category']
+                day = min(self.days - 1, story['day'] + int(rng.integers(0, 3)))
+                title = f"{story['title']} ({media_name})"
+                people = [story['person']]
+                organizations = [story['organization']]
+            else:
+                topic = list(CATEGORIES)[int(rng.integers(len(CATEGORIES)))]
+                category = CATEGORIES[topic][int(rng.integers(len(CATEGORIES[topic])))]
+                day = int(rng.integers(self.days))
+                nouns = [TOPIC_NOUNS[topic][int(i)] for i in rng.integers(len(TOPIC_NOUNS[topic]), size=3)]
+                title = f"{nouns[0]}·{nouns[1]} {nouns[2]} {VERBS[int(rng.integers(len(VERBS)))]}"
+                people = []
+                organizations = []
+
+            people += [PEOPLE[int(i)] for i in rng.integers(len(PEOPLE), size=int(rng.integers(0, 3)))]
+            organizations += [ORGANIZATIONS[int(i)] for i in rng.integers(len(ORGANIZATIONS), size=int(rng.integers(0, 3)))]
+            locations = [LOCATIONS[int(i)] for i in rng.integers(len(LOCATIONS), size=int(rng.integers(0, 3)))]
+
+            article_date = self.start_date + timedelta(days=day)
+            content, nouns = self._content(rng, TOPIC_NOUNS[topic], story)
+            keywords = nouns[:30]
+
+            news_id = self._news_id(media_code, article_date, index)
+            if id_noise and rng.random() < id_noise:
+                # 엑셀 변환 과정에서 흔히 생기는 식별자 손상 재현
+                news_id = f"{media_code}.{article_date:%Y%m%d}" if rng.random() < 0.5 else f"{media_code[1:]}.{index}"
+
+            rows.append((
+                news_id,
+                f"{article_date:%Y-%m-%d}",
+                media_name,
+                f"{PEOPLE[int(rng.integers(len(PEOPLE)))][0]}기자",
+                title,
+                category,
+                '',
+                '',
+                '',
+                '',
+                '',
+                ','.join(dict.fromkeys(people)),
+                ','.join(dict.fromkeys(locations)),
+                ','.join(dict.fromkeys(organizations)),
+                ','.join(keywords),
+                ','.join(dict.fromkeys(keywords)),
+                content,
+                f"https://news.example.com/{media_code}/{index}",
+                '',
+            ))
+
+        return pd.DataFrame(rows, columns=BIGKINDS_COLUMNS)
+
+    def iter_frames(self, chunk_size=10000, id_noise=0.0):
+        """기사를 chunk_size 단위의 DataFrame으로 나누어 생성"""
+        for start in range(0, self.size, chunk_size):
+            yield self.make_frame(start, chunk_size, id_noise=id_noise)
+
+    def cluster_members(self):
+        """클러스터별 기사 인덱스 목록 (정답 데이터)"""
+        members = {}
+        for index, story in sorted(self.clusters.items()):
+            members.setdefault(story['cluster_id'], []).append(index)
+        return members
+
+    def write_csv(self, path, chunk_size=10000):
+        """CSV 파일로 저장 (CSVProcessor 입력 형식)"""
+        for i, df in enumerate(self.iter_frames(chunk_size)):
+            df.to_csv(path, mode='w' if i == 0 else 'a', header=(i == 0), index=False, encoding='utf-8')
+        return path
+
+    def write_xlsx(self, path, id_noise=0.01):
+        """XLSX 파일로 저장 (ExcelConverter 입력 형식, 일자는 YYYYMMDD)"""
+        df = self.make_frame(id_noise=id_noise)
+        df['일자'] = df['일자'].str.replace('-', '', regex=False)
+        df.to_excel(path, index=False)
+        return path
+
+    def write_clusters(self, path):
+        """심어 둔 클러스터 정보를 JSON으로 저장"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(
+                {
+                    'size': self.size,
+                    'seed': self.seed,
+                    'clusters': {str(k): v for k, v in self.cluster_members().items()},
+                },
+                f,
+                ensure_ascii=False
+            )
+        return path
+
+def main():
+    parser = argparse.ArgumentParser(description='합성 빅카인즈 뉴스 코퍼스 생성')
+    parser.add_argument('--size', type=int, default=1000, help='생성할 기사 수 (예: 1000 ~ 1000000)')
+    parser.add_argument('--seed', type=int, default=42, help='난수 시드')
+    parser.add_argument('--output-dir', default='bench_data', help='출력 디렉토리')
+    parser.add_argument('--format', nargs='+', default=['csv'], choices=['csv', 'xlsx'], help='출력 형식')
+    parser.add_argument('--cluster-ratio', type=float, default=0.3, help='유사 기사 클러스터에 속하는 기사 비율')
+    parser.add_argument('--cluster-size', type=int, default=20, help='클러스터 하나의 평균 기사 수')
+    args = parser.parse_args()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    generator = CorpusGenerator(
+        args.size,
+        seed=args.seed,
+        cluster_ratio=args.cluster_ratio,
+        cluster_size=args.cluster_size
+    )
+
+    name = f"synthetic_{args.size}_{args.seed}"
+    if 'csv' in args.format:
+        path = generator.write_csv(os.path.join(args.output_dir, f"{name}.csv"))
+        print(f"CSV 생성 완료: {path}")
+    if 'xlsx' in args.format:
+        path = generator.write_xlsx(os.path.join(args.output_dir, f"{name}.xlsx"))
+        print(f"XLSX 생성 완료: {path}")
+    path = generator.write_clusters(os.path.join(args.output_dir, f"{name}.clusters.json"))
+    print(f"클러스터 정보 저장 완료: {path}")
+
+if __name__ == "__main__":
+    main()
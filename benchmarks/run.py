@@ -0,0 +1,359 @@
+"""처리 단계별 벤치마크 실행기
+
+합성 코퍼스(benchmarks.corpus)로 다음 단계를 각각 측정하고 결과를 JSON으로 저장한다.
+네트워크나 실제 빅카인즈 데이터 없이 노트북에서 버전 간 성능 회귀를 비교하는 용도이다.
+
+    - csv_process_single_file: CSVProcessor.process_single_file (임시 SQLite DB)
+    - excel_validate_news_id: ExcelConverter.validate_news_id
+    - tokenize: IssueExtractor._tokenize (KoNLPy가 설치된 경우만)
+    - tfidf / similarity / grouping / select_issues: extract_issues의 각 단계
+      (--extract-limit개 기사로 코퍼스를 따로 생성하여 측정, 실제 문서 수는 documents에 기록)
+
+진행 상황은 표준 에러로, 결과 JSON은 --output 파일 또는 표준 출력으로 내보낸다.
+
+사용 예:
+    python -m benchmarks.run --sizes 1000 10000 --output bench_output.json
+    python -m benchmarks.run --sizes 100000 --stages csv_process_single_file excel_validate_news_id
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from benchmarks.corpus import CorpusGenerator
+
+# 프로젝트 루트 디렉토리
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STAGES = [
+    'csv_process_single_file',
+    'excel_validate_news_id',
+    'tokenize',
+    'tfidf',
+    'similarity',
+    'grouping',
+    'select_issues',
+]
+
+# 유사도 행렬은 문서 수의 제곱에 비례하므로 이슈 추출 단계는 기사 수를 제한한다
+DEFAULT_EXTRACT_LIMIT = 3000
+
+# 식별자 검증 단계는 전체 코퍼스를 메모리에 만들어야 하므로 기사 수를 제한한다
+DEFAULT_VALIDATE_LIMIT = 20000
+
+class StageSkipped(Exception):
+    """필요한 의존성이 없어 단계를 건너뛰는 경우"""
+
+def time_call(func, repeat, setup=None):
+    """func를 repeat번 실행하여 실행 시간 목록 반환
+
+    Args:
+        func: 측정할 함수 (setup의 반환값을 인자로 받음)
+        repeat (int): 반복 횟수
+        setup: 매 반복 전에 호출되는 준비 함수 (측정 시간에서 제외)
+
+    Returns:
+        tuple: (실행 시간 목록(초), 마지막 실행 결과)
+    """
+    times = []
+    result = None
+    for _ in range(repeat):
+        args = setup() if setup is not None else ()
+        # 진행 메시지 출력은 측정 결과에 섞이지 않도록 버림
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            result = func(*args)
+            times.append(time.perf_counter() - start)
+    return times, result
+
+def summarize(stage, size, n_items, times, **extra):
+    """측정 결과를 하나의 레코드로 정리"""
+    record = {
+        'stage': stage,
+        'size': size,
+        'n_items': n_items,
+        'repeat': len(times),
+        'times': times,
+        'min': min(times),
+        'median': statistics.median(times),
+        'mean': statistics.mean(times),
+        'items_per_second': n_items / min(times) if min(times) > 0 else None,
+    }
+    record.update(extra)
+    return record
+
+def package_versions():
+    """주요 의존성 버전 수집"""
+    versions = {}
+    for name in ['pandas', 'numpy', 'sqlalchemy', 'sklearn', 'konlpy', 'openpyxl']:
+        try:
+            module = __import__(name)
+            versions[name] = getattr(module, '__version__', 'unknown')
+        except ImportError:
+            versions[name] = None
+    return versions
+
+def git_revision():
+    """현재 git 커밋 (git 저장소가 아니면 None)"""
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=BASE_DIR,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+class BenchmarkRunner:
+    """코퍼스 크기별로 각 단계를 측정하는 클래스"""
+
+    def __init__(self, work_dir, repeat=3, seed=42, extract_limit=DEFAULT_EXTRACT_LIMIT,
+                 validate_limit=DEFAULT_VALIDATE_LIMIT):
+        self.work_dir = work_dir
+        self.repeat = repeat
+        self.seed = seed
+        self.extract_limit = extract_limit
+        self.validate_limit = validate_limit
+
+    def _make_session(self, db_path):
+        """벤치마크 전용 SQLite DB 세션 생성"""
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from src.models.news_article import Base
+
+        if os.path.exists(db_path):
+            os.remove(db_path)
+        engine = create_engine(f"sqlite:///{db_path}")
+        Base.metadata.create_all(engine)
+        return sessionmaker(bind=engine)()
+
+    def bench_csv_process_single_file(self, generator, size):
+        from src.data_processing.csv_processor import CSVProcessor
+
+        csv_path = os.path.join(self.work_dir, f"synthetic_{size}_{self.seed}.csv")
+        if not os.path.exists(csv_path):
+            generator.write_csv(csv_path)
+        sessions = []
+
+        def setup():
+            # 매 반복마다 빈 DB와 새 처리기로 시작
+            db_path = os.path.join(self.work_dir, f"bench_{size}_{len(sessions)}.db")
+            session = self._make_session(db_path)
+            sessions.append(session)
+            return CSVProcessor(), csv_path, session, set()
+
+        def process(processor, *args):
+            return processor.process_single_file(*args)
+
+        try:
+            times, result = time_call(process, self.repeat, setup)
+        finally:
+            for session in sessions:
+                session.close()
+
+        new_count, skipped_count, error_occurred = result
+        return summarize(
+            'csv_process_single_file', size, size, times,
+            new_articles=new_count,
+            skipped=skipped_count,
+            file_bytes=os.path.getsize(csv_path)
+        )
+
+    def bench_excel_validate_news_id(self, generator, size):
+        from src.data_processing.excel_converter import ExcelConverter
+
+        # 코퍼스는 한 번만 생성하고, 반복마다 얕은 복사본을 사용
+        # (validate_news_id는 컬럼을 통째로 교체하므로 원본 데이터는 바뀌지 않음)
+        df = generator.make_frame(count=min(generator.size, self.validate_limit), id_noise=0.01)
+        converter = ExcelConverter()
+        times, result = time_call(converter.validate_news_id, self.repeat, lambda: (df.copy(deep=False),))
+        return summarize('excel_validate_news_id', size, len(df), times,
+                         valid_rows=len(result), validate_limit=self.validate_limit)
+
+    def _extract_inputs(self, size):
+        """이슈 추출 단계용 입력 (기사 수 제한 적용)
+
+        전체 코퍼스의 앞부분을 자르면 클러스터 기사가 대부분 빠지므로,
+        제한된 기사 수로 코퍼스를 새로 생성하여 클러스터 비율과 크기를 유지한다.
+
+        Returns:
+            tuple: (뉴스 ID 리스트, 제목 리스트, 텍스트 리스트, 결과에 기록할 표본 정보)
+        """
+        generator = CorpusGenerator(min(size, self.extract_limit), seed=self.seed)
+        df = generator.make_frame()
+        news_ids = df['뉴스 식별자'].tolist()
+        titles = df['제목'].tolist()
+        texts = [f"{title} {content}" for title, content in zip(titles, df['본문'])]
+        cluster_sizes = [len(members) for members in generator.cluster_members().values()]
+        sample = {
+            'documents': len(texts),
+            'extract_limit': self.extract_limit,
+            'planted_clusters': sum(1 for n in cluster_sizes if n >= 2),
+            'largest_cluster': max(cluster_sizes, default=0),
+        }
+        return news_ids, titles, texts, sample
+
+    def _make_extractor(self, tokenizer=None):
+        from src.analysis.issue_extractor import IssueExtractor
+
+        session = self._make_session(os.path.join(self.work_dir, 'bench_extract.db'))
+        return IssueExtractor(session=session, tokenizer=tokenizer)
+
+    def bench_tokenize(self, generator, size):
+        try:
+            import konlpy  # noqa: F401
+        except ImportError:
+            raise StageSkipped("KoNLPy가 설치되어 있지 않습니다.")
+
+        _, _, texts, sample = self._extract_inputs(size)
+        extractor = self._make_extractor()
+        try:
+            # JVM 기동과 Okt 초기화는 측정에서 제외
+            extractor._tokenize(texts[0])
+            times, _ = time_call(extractor._tokenize_texts, self.repeat, lambda: (texts,))
+        finally:
+            extractor.session.close()
+        return summarize('tokenize', size, len(texts), times, **sample)
+
+    def bench_extract_stages(self, generator, size, stages):
+        """TF-IDF, 유사도, 그룹화, 이슈 선택 단계 측정"""
+        try:
+            import konlpy  # noqa: F401
+            tokenizer_name = 'okt'
+            extractor = self._make_extractor()
+        except ImportError:
+            # Okt를 쓸 수 없으면 어절 단위 토큰화로 대체 (결과에 기록)
+            tokenizer_name = 'whitespace'
+            extractor = self._make_extractor(tokenizer=str.split)
+
+        news_ids, titles, texts, sample = self._extract_inputs(size)
+        results = []
+        try:
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                tokenized_texts = extractor._tokenize_texts(texts)
+            extra = {'tokenizer': tokenizer_name, **sample}
+            n_docs = len(texts)
+
+            times, tfidf_matrix = time_call(extractor._vectorize, self.repeat, lambda: (tokenized_texts,))
+            if 'tfidf' in stages:
+                results.append(summarize('tfidf', size, n_docs, times,
+                                         vocabulary_size=tfidf_matrix.shape[1], **extra))
+
+            times, similarities = time_call(extractor._compute_similarities, self.repeat, lambda: (tfidf_matrix,))
+            if 'similarity' in stages:
+                results.append(summarize('similarity', size, n_docs, times, **extra))
+
+            times, document_groups = time_call(extractor._group_documents, self.repeat, lambda: (similarities, 0.3))
+            if 'grouping' in stages:
+                results.append(summarize('grouping', size, n_docs, times,
+                                         grouped_documents=len(document_groups), **extra))
+
+            if 'select_issues' in stages:
+                times, issues = time_call(
+                    extractor._select_issues, self.repeat,
+                    lambda: (document_groups, tfidf_matrix, news_ids, titles, 10)
+                )
+                results.append(summarize('select_issues', size, n_docs, times, issues=len(issues), **extra))
+        finally:
+            extractor.session.close()
+        return results
+
+    def run(self, sizes, stages):
+        """크기와 단계별 벤치마크 실행"""
+        results = []
+        extract_stages = [s for s in stages if s in ('tfidf', 'similarity', 'grouping', 'select_issues')]
+
+        for size in sizes:
+            print(f"\n=== 기사 {size}개 ===", file=sys.stderr)
+            generator = CorpusGenerator(size, seed=self.seed)
+
+            jobs = []
+            if 'csv_process_single_file' in stages:
+                jobs.append(('csv_process_single_file', self.bench_csv_process_single_file))
+            if 'excel_validate_news_id' in stages:
+                jobs.append(('excel_validate_news_id', self.bench_excel_validate_news_id))
+            if 'tokenize' in stages:
+                jobs.append(('tokenize', self.bench_tokenize))
+            if extract_stages:
+                jobs.append((
+                    ', '.join(extract_stages),
+                    lambda g, s: self.bench_extract_stages(g, s, extract_stages)
+                ))
+
+            for name, job in jobs:
+                try:
+                    records = job(generator, size)
+                except StageSkipped as e:
+                    print(f"[건너뜀] {name}: {e}", file=sys.stderr)
+                    results.append({'stage': name, 'size': size, 'skipped': str(e)})
+                    continue
+
+                for record in records if isinstance(records, list) else [records]:
+                    print(f"{record['stage']}: 최소 {record['min']:.4f}초, 중앙값 {record['median']:.4f}초 "
+                          f"({record['n_items']}건)", file=sys.stderr)
+                    results.append(record)
+
+        return results
+
+def main():
+    parser = argparse.ArgumentParser(description='뉴스 처리 단계별 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000], help='코퍼스 기사 수 목록')
+    parser.add_argument('--stages', nargs='+', default=STAGES, choices=STAGES, help='측정할 단계')
+    parser.add_argument('--repeat', type=int, default=3, help='단계별 반복 횟수')
+    parser.add_argument('--seed', type=int, default=42, help='코퍼스 난수 시드')
+    parser.add_argument('--extract-limit', type=int, default=DEFAULT_EXTRACT_LIMIT,
+                        help='이슈 추출 단계에 사용할 최대 기사 수')
+    parser.add_argument('--validate-limit', type=int, default=DEFAULT_VALIDATE_LIMIT,
+                        help='식별자 검증 단계에 사용할 최대 기사 수')
+    parser.add_argument('--work-dir', default=None, help='코퍼스와 임시 DB를 저장할 디렉토리 (기본: 임시 디렉토리)')
+    parser.add_argument('--output', default=None, help='결과 JSON 파일 경로 (기본: 표준 출력)')
+    args = parser.parse_args()
+
+    with contextlib.ExitStack() as stack:
+        work_dir = args.work_dir or stack.enter_context(tempfile.TemporaryDirectory())
+        os.makedirs(work_dir, exist_ok=True)
+
+        runner = BenchmarkRunner(
+            work_dir,
+            repeat=args.repeat,
+            seed=args.seed,
+            extract_limit=args.extract_limit,
+            validate_limit=args.validate_limit
+        )
+        results = runner.run(args.sizes, args.stages)
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'git_revision': git_revision(),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'packages': package_versions(),
+            'seed': args.seed,
+            'repeat': args.repeat,
+            'sizes': args.sizes,
+        },
+        'results': results,
+    }
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+        print(f"\n결과 저장 완료: {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""main.py 명령어별 시작 시간 벤치마크
+
+`python -X importtime` 출력을 이용해 각 명령어가 실제 작업을 시작하기 전까지
+걸리는 시간과 불러오는 모듈을 측정하고, 정해진 예산을 넘으면 실패로 처리한다.
+
+사용 예:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --repeat 10 --help-budget 0.3 --save-budget 2.0
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# 프로젝트 루트 디렉토리
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN_PATH = os.path.join(BASE_DIR, 'main.py')
+
+# 존재하지 않는 파일 패턴: save 명령어가 DB에 접근하기 전에 종료되도록 한다
+MISSING_PATTERN = '__startup_benchmark_no_such_file__.csv'
+
+# 명령어별 측정 설정
+#   args: main.py에 전달할 인자
+#   budget: 기본 시간 예산 (초, 프로세스 실행 시간의 중앙값 기준)
+#   forbidden: 시작 단계에서 불러와서는 안 되는 최상위 모듈
+#   expect: 정상적으로 시작했다면 출력(stdout+stderr)에 포함되어야 하는 문자열
+SCENARIOS = {
+    'help': {
+        'args': ['--help'],
+        'budget': 0.3,
+        'forbidden': ['pandas', 'numpy', 'sqlalchemy', 'sklearn', 'konlpy'],
+        'expect': 'usage:',
+    },
+    'save': {
+        'args': ['save', '--pattern', MISSING_PATTERN],
+        'budget': 2.0,
+        'forbidden': ['sklearn', 'konlpy', 'scipy'],
+        'expect': 'FileNotFoundError',
+    },
+}
+
+def parse_importtime(stderr):
+    """-X importtime 출력을 파싱
+
+    Returns:
+        tuple: (최상위 import 누적 시간 합계(초), 불러온 모듈 이름 집합)
+    """
+    total_us = 0
+    modules = set()
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        try:
+            _, cumulative, name = line[len('import time:'):].split('|')
+        except ValueError:
+            continue
+        # 들여쓰기가 없는 모듈이 최상위 import
+        if not name.startswith('  ', 1):
+            total_us += int(cumulative)
+        modules.add(name.strip())
+    return total_us / 1_000_000, modules
+
+def run_scenario(name, scenario, repeat):
+    """단일 명령어를 반복 실행하여 시작 시간 측정"""
+    wall_times = []
+    import_times = []
+    modules = set()
+    error = None
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', MAIN_PATH] + scenario['args'],
+            cwd=BASE_DIR,
+            capture_output=True,
+            text=True
+        )
+        wall_times.append(time.perf_counter() - start)
+
+        if scenario['expect'] not in result.stdout + result.stderr:
+            # 의존성 누락 등으로 명령어가 정상적으로 시작되지 못한 경우
+            error = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else f"종료 코드 {result.returncode}"
+
+        import_time, loaded = parse_importtime(result.stderr)
+        import_times.append(import_time)
+        modules |= loaded
+
+    top_level = {module.split('.')[0] for module in modules}
+    forbidden = sorted(set(scenario['forbidden']) & top_level)
+
+    return {
+        'command': name,
+        'repeat': repeat,
+        'wall_median': statistics.median(wall_times),
+        'wall_min': min(wall_times),
+        'import_median': statistics.median(import_times),
+        'module_count': len(modules),
+        'budget': scenario['budget'],
+        'forbidden_imports': forbidden,
+        'error': error,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='main.py 시작 시간 벤치마크')
+    parser.add_argument('--repeat', type=int, default=5, help='명령어별 반복 실행 횟수')
+    parser.add_argument('--help-budget', type=float, default=SCENARIOS['help']['budget'],
+                        help='main.py --help 시간 예산 (초)')
+    parser.add_argument('--save-budget', type=float, default=SCENARIOS['save']['budget'],
+                        help='main.py save 시간 예산 (초)')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    SCENARIOS['help']['budget'] = args.help_budget
+    SCENARIOS['save']['budget'] = args.save_budget
+
+    results = [run_scenario(name, scenario, args.repeat) for name, scenario in SCENARIOS.items()]
+
+    failed = False
+    for result in results:
+        result['passed'] = (
+            result['error'] is None
+            and result['wall_median'] <= result['budget']
+            and not result['forbidden_imports']
+        )
+        failed = failed or not result['passed']
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+    else:
+        print("\n=== main.py 시작 시간 ===")
+        for result in results:
+            status = "통과" if result['passed'] else "실패"
+            print(f"[{status}] main.py {result['command']}")
+            print(f"  - 실행 시간(중앙값): {result['wall_median']:.3f}초 (예산 {result['budget']:.3f}초)")
+            print(f"  - import 시간(중앙값): {result['import_median']:.3f}초")
+            print(f"  - 불러온 모듈 수: {result['module_count']}개")
+            if result['error']:
+                print(f"  - 시작 실패: {result['error']}")
+            if result['forbidden_imports']:
+                print(f"  - 불러오면 안 되는 모듈: {', '.join(result['forbidden_imports'])}")
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
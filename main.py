@@ -1,38 +1,82 @@
 import argparse
-from src.data_processing.csv_processor import CSVProcessor
-from src.analysis.issue_extractor import extract_main_issues
+import cProfile
+from src.utils.metrics import PipelineMetrics
 
-def main():
-    # 명령행 인자 파싱
+# 각 명령어의 무거운 의존성(pandas, scikit-learn, KoNLPy 등)은
+# 해당 명령어가 실행될 때만 불러온다.
+
+def run_save(args, metrics):
+    """CSV 파일 DB 저장"""
+    from src.data_processing.csv_processor import CSVProcessor
+
+    processor = CSVProcessor(metrics=metrics)
+    processor.process_files(args.pattern, force=args.force)
+
+def run_issues(args, metrics):
+    """주요 이슈 추출"""
+    from src.analysis.issue_extractor import extract_main_issues
+
+    return extract_main_issues(
+        args.start_date,
+        args.end_date,
+        args.category,
+        args.n_issues,
+        metrics=metrics,
+        entities={
+            'person': args.person,
+            'location': args.location,
+            'organization': args.org
+        }
+    )
+
+def build_parser():
+    """명령행 인자 파서 생성"""
     parser = argparse.ArgumentParser(description='뉴스 기사 처리 및 이슈 추출')
+    parser.add_argument('--metrics-out', help='단계별 측정 결과(JSON Lines)를 추가할 파일 (기본: 표준 출력)')
+    parser.add_argument('--profile', help='cProfile 결과(pstats 형식)를 저장할 파일')
     subparsers = parser.add_subparsers(dest='command', help='수행할 작업')
-    
+
     # CSV 저장 명령어
     save_parser = subparsers.add_parser('save', help='CSV 파일을 DB에 저장')
     save_parser.add_argument('--pattern', default='*.csv', help='CSV 파일 패턴 (예: *.csv, news_*.csv)')
-    
+    save_parser.add_argument('--force', action='store_true', help='적재 이력을 무시하고 모든 파일을 다시 처리')
+    save_parser.set_defaults(handler=run_save)
+
     # 이슈 추출 명령어
     issue_parser = subparsers.add_parser('issues', help='주요 이슈 추출')
     issue_parser.add_argument('--start-date', required=True, help='시작 날짜 (YYYY-MM-DD)')
     issue_parser.add_argument('--end-date', required=True, help='종료 날짜 (YYYY-MM-DD)')
     issue_parser.add_argument('--category', required=True, choices=['정치', '경제', '사회'], help='카테고리')
     issue_parser.add_argument('--n-issues', type=int, default=10, help='추출할 이슈 개수')
-    
+    issue_parser.add_argument('--person', action='append', help='인물 필터 (여러 번 지정 가능, 모두 등장한 기사만)')
+    issue_parser.add_argument('--location', action='append', help='위치 필터 (여러 번 지정 가능)')
+    issue_parser.add_argument('--org', action='append', help='기관 필터 (여러 번 지정 가능)')
+    issue_parser.set_defaults(handler=run_issues)
+
+    return parser
+
+def main():
+    # 명령행 인자 파싱
+    parser = build_parser()
     args = parser.parse_args()
-    
-    if args.command == 'save':
-        # CSV 파일 DB 저장
-        processor = CSVProcessor()
-        processor.process_files(args.pattern)
-    
-    elif args.command == 'issues':
-        # 주요 이슈 추출
-        issues = extract_main_issues(
-            args.start_date,
-            args.end_date,
-            args.category,
-            args.n_issues
-        )
+
+    if getattr(args, 'handler', None) is None:
+        parser.print_help()
+        return
+
+    metrics = PipelineMetrics(args.command)
+    profiler = cProfile.Profile() if args.profile else None
+
+    try:
+        if profiler is not None:
+            profiler.enable()
+        args.handler(args, metrics)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+            print(f"프로파일 저장 완료: {args.profile}")
+        metrics.emit(args.metrics_out)
 
 if __name__ == "__main__":
     main()
@@ -1,10 +1,19 @@
-from utils.db_config import get_session
-from models import NewsArticle
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+sys.path.insert(0, project_root)
+
+from src.utils.db_config import get_session, ensure_table_exists
+from src.models import ArticleDailyCount
 
 def check_categories():
+    ensure_table_exists()
     session = get_session()
     try:
-        categories = session.query(NewsArticle.category1).distinct().all()
+        # 전체 기사 대신 집계 테이블에서 카테고리 목록 조회
+        categories = session.query(ArticleDailyCount.category1).distinct().order_by(ArticleDailyCount.category1).all()
         print("\n=== 데이터베이스의 카테고리 목록 ===")
         for category in categories:
             print(category[0])
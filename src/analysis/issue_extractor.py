@@ -1,11 +1,16 @@
 from datetime import datetime
 from typing import Dict, List, Tuple
+import numpy as np
+from scipy.sparse import csr_matrix
+from sqlalchemy import select
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
-from konlpy.tag import Okt
 from collections import defaultdict
-from src.models import NewsArticle
-from src.utils.db_config import get_session
+from src.models import NewsArticle, Entity, ArticleEntity
+from src.utils.db_config import get_session, ensure_table_exists
+from src.utils.article_stats import count_articles
+from src.utils.entity_index import resolve_entity_ids
+from src.utils.metrics import PipelineMetrics
 
 # 카테고리 상수 정의
 CATEGORY_MAPPING = {
@@ -48,25 +53,136 @@ CATEGORY_MAPPING = {
     ]
 }
 
+# 개체 종류 표시 이름
+ENTITY_LABELS = {
+    'person': '인물',
+    'location': '위치',
+    'organization': '기관',
+}
+
+def _identity(tokens):
+    """이미 토큰화된 문서를 그대로 반환 (TfidfVectorizer analyzer 용)"""
+    return tokens
+
 class IssueExtractor:
     """뉴스 기사에서 주요 이슈를 추출하는 클래스"""
     
-    def __init__(self):
-        """이슈 추출기 초기화"""
-        self.session = get_session()
-        self.okt = Okt()
+    def __init__(self, session=None, tokenizer=None, metrics=None):
+        """이슈 추출기 초기화
+
+        Args:
+            session: DB 세션 (없으면 새로 생성)
+            tokenizer: 텍스트를 토큰 리스트로 변환하는 함수 (없으면 Okt 명사 추출)
+            metrics: 단계별 측정 기록 (PipelineMetrics, 없으면 새로 생성)
+        """
+        self.session = session if session is not None else get_session()
+        self.metrics = metrics if metrics is not None else PipelineMetrics('extract')
+        self._okt = None
+        self.tokenizer = tokenizer if tokenizer is not None else self._tokenize
         self.vectorizer = TfidfVectorizer(
             min_df=2,  # 최소 2개의 문서에서 등장해야 함
             max_df=0.9,  # 90% 이상의 문서에서 등장하는 단어는 제외
-            tokenizer=self._tokenize
+            analyzer=_identity  # 토큰화는 _tokenize_texts에서 미리 수행
         )
     
+    @property
+    def okt(self):
+        """Okt 형태소 분석기 (JVM 기동 비용 때문에 처음 사용할 때 생성)"""
+        if self._okt is None:
+            from konlpy.tag import Okt
+            self._okt = Okt()
+        return self._okt
+    
     def _tokenize(self, text: str) -> List[str]:
         """텍스트를 형태소 분석하여 명사만 추출"""
         return self.okt.nouns(text)
     
-    def _filter_articles(self, start_date: datetime.date, end_date: datetime.date, category: str) -> List[Tuple[str, str, str]]:
-        """주어진 기간과 카테고리에 해당하는 기사 필터링"""
+    def _tokenize_texts(self, texts: List[str]) -> List[List[str]]:
+        """여러 문서를 토큰 리스트로 변환"""
+        return [self.tokenizer(text) for text in texts]
+    
+    def _vectorize(self, tokenized_texts: List[List[str]]):
+        """토큰화된 문서들의 TF-IDF 행렬 계산"""
+        return self.vectorizer.fit_transform(tokenized_texts)
+    
+    def _compute_similarities(self, tfidf_matrix):
+        """문서 간 코사인 유사도 행렬 계산"""
+        return cosine_similarity(tfidf_matrix)
+    
+    def _group_documents(self, similarities, similarity_threshold: float) -> Dict[int, set]:
+        """유사도 임계값을 넘는 문서끼리 그룹화
+        
+        Returns:
+            {문서 인덱스: 유사한 문서 인덱스 집합} 형태의 딕셔너리
+        """
+        document_groups = defaultdict(set)
+        for i in range(len(similarities)):
+            for j in range(i + 1, len(similarities)):
+                if similarities[i, j] > similarity_threshold:
+                    document_groups[i].add(j)
+                    document_groups[j].add(i)
+        return document_groups
+    
+    def _select_issues(self, document_groups, tfidf_matrix, news_ids, titles, n_issues: int) -> Dict[str, dict]:
+        """그룹 크기순으로 주요 이슈 선택"""
+        # 그룹 크기순으로 정렬
+        sorted_groups = sorted(
+            document_groups.items(),
+            key=lambda x: len(x[1]),
+            reverse=True
+        )
+        
+        # 주요 이슈 추출
+        processed_docs = set()
+        issues = {}
+        feature_names = self.vectorizer.get_feature_names_out()
+        
+        for main_doc, similar_docs in sorted_groups:
+            # 이미 처리된 문서는 건너뛰기
+            if main_doc in processed_docs:
+                continue
+                
+            # 현재 그룹의 모든 문서 ID
+            group_docs = similar_docs | {main_doc}
+            
+            # 그룹 내 문서들의 TF-IDF 벡터 평균
+            group_vector = tfidf_matrix[list(group_docs)].mean(axis=0)
+            
+            # 가장 중요한 단어 추출
+            top_word_idx = group_vector.argmax()
+            issue_keyword = feature_names[top_word_idx]
+            
+            # 그룹 내 뉴스 ID 수집
+            group_news_ids = [news_ids[i] for i in group_docs]
+            
+            # 그룹의 대표 기사 제목 (첫 번째 기사)
+            representative_title = titles[main_doc]
+            
+            # 결과 저장
+            issues[issue_keyword] = {
+                'news_ids': group_news_ids,
+                'title': representative_title,
+                'article_count': len(group_news_ids)
+            }
+            
+            # 처리된 문서 표시
+            processed_docs.update(group_docs)
+            
+            # 원하는 이슈 개수에 도달하면 종료
+            if len(issues) >= n_issues:
+                break
+        
+        return issues
+    
+    def _count_articles(self, start_date: datetime.date, end_date: datetime.date, category: str) -> int:
+        """집계 테이블로 기간과 카테고리에 해당하는 기사 수 계산 (본문 조회 없음)"""
+        if category in CATEGORY_MAPPING:
+            return count_articles(self.session, start_date, end_date, categories=CATEGORY_MAPPING[category])
+        return count_articles(self.session, start_date, end_date, category_prefix=category)
+    
+    def _filter_articles(self, start_date: datetime.date, end_date: datetime.date, category: str,
+                         entity_ids: List[int] = None) -> List[Tuple[str, str, str]]:
+        """주어진 기간과 카테고리에 해당하는 기사 필터링 (entity_ids가 있으면 모든 개체가 등장한 기사만)"""
         query = self.session.query(
             NewsArticle.news_id,
             NewsArticle.title,
@@ -83,16 +199,93 @@ class IssueExtractor:
             # 다른 카테고리의 경우 기존 로직 유지
             query = query.filter(NewsArticle.category1.startswith(category))
         
+        # 개체 필터: 역색인으로 해당 개체가 등장한 기사만 남김
+        for entity_id in entity_ids or []:
+            query = query.filter(NewsArticle.news_id.in_(
+                select(ArticleEntity.news_id).where(ArticleEntity.entity_id == entity_id)
+            ))
+        
         articles = query.all()
         print(f"\n검색된 기사 수: {len(articles)}개")
         return [(article.news_id, article.title, article.content) for article in articles]
 
+    def _cooccurring_entities(self, issues: Dict[str, dict], exclude_entity_ids=(), top_n: int = 5) -> None:
+        """이슈별로 함께 등장한 상위 개체를 계산하여 'top_entities'에 추가
+        
+        (이슈 × 기사) 소속 행렬과 (기사 × 개체) 역색인 행렬의 희소 행렬 곱으로
+        이슈별 개체 등장 기사 수를 구한다.
+        """
+        issue_keys = list(issues)
+        doc_ids = list(dict.fromkeys(news_id for key in issue_keys for news_id in issues[key]['news_ids']))
+        doc_index = {news_id: i for i, news_id in enumerate(doc_ids)}
+        
+        # 역색인 조회 (IN 조건의 파라미터 수 제한 때문에 나누어 조회)
+        posting_rows, posting_entities = [], []
+        for start in range(0, len(doc_ids), 500):
+            chunk = doc_ids[start:start + 500]
+            for news_id, entity_id in self.session.query(ArticleEntity.news_id, ArticleEntity.entity_id).filter(
+                ArticleEntity.news_id.in_(chunk)
+            ):
+                posting_rows.append(doc_index[news_id])
+                posting_entities.append(entity_id)
+        
+        for key in issue_keys:
+            issues[key]['top_entities'] = []
+        if not posting_entities:
+            return
+        
+        entity_list = sorted(set(posting_entities))
+        entity_col = {entity_id: i for i, entity_id in enumerate(entity_list)}
+        doc_entity = csr_matrix(
+            (np.ones(len(posting_rows)), (posting_rows, [entity_col[e] for e in posting_entities])),
+            shape=(len(doc_ids), len(entity_list))
+        )
+        
+        membership_rows, membership_cols = [], []
+        for i, key in enumerate(issue_keys):
+            for news_id in set(issues[key]['news_ids']):
+                membership_rows.append(i)
+                membership_cols.append(doc_index[news_id])
+        membership = csr_matrix(
+            (np.ones(len(membership_rows)), (membership_rows, membership_cols)),
+            shape=(len(issue_keys), len(doc_ids))
+        )
+        
+        # 이슈 × 개체 동시 등장 기사 수
+        cooccurrence = (membership @ doc_entity).tocsr()
+        excluded_cols = {entity_col[e] for e in exclude_entity_ids if e in entity_col}
+        
+        # 상위 개체 선택
+        top_cols = {}
+        for i, key in enumerate(issue_keys):
+            start, end = cooccurrence.indptr[i], cooccurrence.indptr[i + 1]
+            cols, counts = cooccurrence.indices[start:end], cooccurrence.data[start:end]
+            order = np.lexsort((cols, -counts))
+            top_cols[key] = [(cols[j], int(counts[j])) for j in order if cols[j] not in excluded_cols][:top_n]
+        
+        # 개체 이름 조회
+        used_ids = list({entity_list[col] for top in top_cols.values() for col, _ in top})
+        names = {}
+        for start in range(0, len(used_ids), 500):
+            chunk = used_ids[start:start + 500]
+            for entity_id, entity_type, name in self.session.query(Entity.id, Entity.entity_type, Entity.name).filter(
+                Entity.id.in_(chunk)
+            ):
+                names[entity_id] = (entity_type, name)
+        
+        for key, top in top_cols.items():
+            issues[key]['top_entities'] = [
+                {'type': names[entity_list[col]][0], 'name': names[entity_list[col]][1], 'count': count}
+                for col, count in top
+            ]
+
     def extract_issues(self, 
                       start_date: datetime.date,
                       end_date: datetime.date,
                       category: str,
                       n_issues: int = 10,
-                      similarity_threshold: float = 0.3) -> Dict[str, List[str]]:
+                      similarity_threshold: float = 0.3,
+                      entities: Dict[str, List[str]] = None) -> Dict[str, List[str]]:
         """주요 이슈 추출
         
         Args:
@@ -101,6 +294,7 @@ class IssueExtractor:
             category: 카테고리 (정치/경제/사회)
             n_issues: 추출할 이슈 개수
             similarity_threshold: 유사도 임계값
+            entities: 개체 필터 {개체 종류(person/location/organization): [이름 리스트]}
             
         Returns:
             {이슈 키워드: [관련 뉴스 ID 리스트]} 형태의 딕셔너리
@@ -108,7 +302,29 @@ class IssueExtractor:
         try:
             print(f"\n[1/5] 기사 필터링 중...")
             # 기사 필터링
-            articles = self._filter_articles(start_date, end_date, category)
+            with self.metrics.stage('fetch', category=category) as stage:
+                # 집계 테이블로 먼저 기사 수를 확인하여 빈 기간은 바로 종료
+                expected_count = self._count_articles(start_date, end_date, category)
+                stage.extra['expected_articles'] = expected_count
+                
+                # 개체 필터 확인 (사전에 없는 개체가 있으면 해당 기사도 없음)
+                entity_ids = resolve_entity_ids(self.session, entities)
+                if entity_ids is None:
+                    print("개체 사전에 없는 개체가 포함되어 있습니다.")
+                elif entity_ids:
+                    stage.extra['entity_filters'] = len(entity_ids)
+                
+                if expected_count and entity_ids is not None:
+                    # 유사도 행렬은 기사 수의 제곱(float64)만큼 메모리를 사용
+                    # (집계 테이블에는 개체 정보가 없으므로 개체 필터가 있으면 상한값)
+                    label = "예상 기사 수 (개체 필터 적용 전 상한)" if entity_ids else "예상 기사 수"
+                    print(f"{label}: {expected_count}개 (유사도 행렬 약 {expected_count ** 2 * 8 / 1024 ** 2:.1f}MB)")
+                    articles = self._filter_articles(start_date, end_date, category, entity_ids)
+                    if entity_ids:
+                        print(f"개체 필터 적용 후 기사 수: {len(articles)}개 (유사도 행렬 약 {len(articles) ** 2 * 8 / 1024 ** 2:.1f}MB)")
+                else:
+                    articles = []
+                stage.items = len(articles)
             if not articles:
                 print("해당 기간에 기사가 없습니다.")
                 return {}
@@ -116,70 +332,41 @@ class IssueExtractor:
             print(f"\n[2/5] 기사 텍스트 처리 중...")
             # 기사 ID와 텍스트 분리
             news_ids, titles, contents = zip(*articles)
+            # 제목과 본문을 결합하여 형태소 분석
+            with self.metrics.stage('tokenize') as stage:
+                texts = [f"{title} {content}" for title, content in zip(titles, contents)]
+                tokenized_texts = self._tokenize_texts(texts)
+                stage.items = len(tokenized_texts)
+                stage.extra['tokens'] = sum(len(tokens) for tokens in tokenized_texts)
             
             print(f"\n[3/5] TF-IDF 계산 중...")
-            # 제목과 본문을 결합하여 TF-IDF 계산
-            texts = [f"{title} {content}" for title, content in zip(titles, contents)]
-            tfidf_matrix = self.vectorizer.fit_transform(texts)
+            with self.metrics.stage('tfidf') as stage:
+                tfidf_matrix = self._vectorize(tokenized_texts)
+                stage.items = tfidf_matrix.shape[0]
+                stage.extra['vocabulary_size'] = tfidf_matrix.shape[1]
+                stage.extra['nnz'] = tfidf_matrix.nnz
             
             print(f"\n[4/5] 문서 간 유사도 계산 중...")
-            # 문서 간 유사도 계산
-            similarities = cosine_similarity(tfidf_matrix)
+            with self.metrics.stage('similarity') as stage:
+                similarities = self._compute_similarities(tfidf_matrix)
+                stage.items = similarities.shape[0]
+                stage.extra['matrix_bytes'] = similarities.nbytes
             
             print(f"\n[5/5] 이슈 그룹화 중...")
             # 각 문서별로 유사한 문서 그룹화
-            document_groups = defaultdict(set)
-            for i in range(len(similarities)):
-                for j in range(i + 1, len(similarities)):
-                    if similarities[i, j] > similarity_threshold:
-                        document_groups[i].add(j)
-                        document_groups[j].add(i)
+            with self.metrics.stage('grouping') as stage:
+                document_groups = self._group_documents(similarities, similarity_threshold)
+                stage.items = len(similarities)
+                stage.extra['grouped_documents'] = len(document_groups)
             
-            # 그룹 크기순으로 정렬
-            sorted_groups = sorted(
-                document_groups.items(),
-                key=lambda x: len(x[1]),
-                reverse=True
-            )
+            with self.metrics.stage('select_issues') as stage:
+                issues = self._select_issues(document_groups, tfidf_matrix, news_ids, titles, n_issues)
+                stage.items = len(issues)
             
-            # 주요 이슈 추출
-            processed_docs = set()
-            issues = {}
-            
-            for main_doc, similar_docs in sorted_groups:
-                # 이미 처리된 문서는 건너뛰기
-                if main_doc in processed_docs:
-                    continue
-                    
-                # 현재 그룹의 모든 문서 ID
-                group_docs = similar_docs | {main_doc}
-                
-                # 그룹 내 문서들의 TF-IDF 벡터 평균
-                group_vector = tfidf_matrix[list(group_docs)].mean(axis=0)
-                
-                # 가장 중요한 단어 추출
-                top_word_idx = group_vector.argmax()
-                issue_keyword = self.vectorizer.get_feature_names_out()[top_word_idx]
-                
-                # 그룹 내 뉴스 ID 수집
-                group_news_ids = [news_ids[i] for i in group_docs]
-                
-                # 그룹의 대표 기사 제목 (첫 번째 기사)
-                representative_title = titles[main_doc]
-                
-                # 결과 저장
-                issues[issue_keyword] = {
-                    'news_ids': group_news_ids,
-                    'title': representative_title,
-                    'article_count': len(group_news_ids)
-                }
-                
-                # 처리된 문서 표시
-                processed_docs.update(group_docs)
-                
-                # 원하는 이슈 개수에 도달하면 종료
-                if len(issues) >= n_issues:
-                    break
+            # 이슈별 동시 등장 개체 (필터로 지정한 개체는 제외)
+            with self.metrics.stage('entities') as stage:
+                self._cooccurring_entities(issues, exclude_entity_ids=entity_ids)
+                stage.items = len(issues)
             
             return issues
             
@@ -189,7 +376,9 @@ class IssueExtractor:
 def extract_main_issues(start_date: str,
                        end_date: str,
                        category: str,
-                       n_issues: int = 10) -> Dict[str, List[str]]:
+                       n_issues: int = 10,
+                       metrics: PipelineMetrics = None,
+                       entities: Dict[str, List[str]] = None) -> Dict[str, List[str]]:
     """주요 이슈 추출 함수
     
     Args:
@@ -197,6 +386,8 @@ def extract_main_issues(start_date: str,
         end_date: 종료 날짜 (YYYY-MM-DD 형식)
         category: 카테고리 (정치/경제/사회)
         n_issues: 추출할 이슈 개수
+        metrics: 단계별 측정 기록 (PipelineMetrics)
+        entities: 개체 필터 {개체 종류(person/location/organization): [이름 리스트]}
         
     Returns:
         {이슈 키워드: [관련 뉴스 ID 리스트]} 형태의 딕셔너리
@@ -205,14 +396,20 @@ def extract_main_issues(start_date: str,
     start = datetime.strptime(start_date, '%Y-%m-%d').date()
     end = datetime.strptime(end_date, '%Y-%m-%d').date()
     
+    # 테이블 존재 확인 (집계 테이블이 없으면 생성)
+    ensure_table_exists()
+    
     # 이슈 추출
-    extractor = IssueExtractor()
-    issues = extractor.extract_issues(start, end, category, n_issues)
+    extractor = IssueExtractor(metrics=metrics)
+    issues = extractor.extract_issues(start, end, category, n_issues, entities=entities)
     
     # 결과 출력
     print(f"\n=== 주요 이슈 추출 결과 ===")
     print(f"기간: {start_date} ~ {end_date}")
     print(f"카테고리: {category}")
+    for entity_type, names in (entities or {}).items():
+        if names:
+            print(f"{ENTITY_LABELS[entity_type]} 필터: {', '.join(names)}")
     print(f"추출된 이슈 수: {len(issues)}")
     
     for keyword, issue_data in issues.items():
@@ -220,3 +417,11 @@ def extract_main_issues(start_date: str,
         print(f"대표 기사 제목: {issue_data['title']}")
         print(f"관련 기사 수: {issue_data['article_count']}")
         print(f"관련 기사 ID: {', '.join(issue_data['news_ids'][:5])}...")
+        if issue_data.get('top_entities'):
+            top_entities = [
+                f"{entity['name']}({ENTITY_LABELS[entity['type']]}) {entity['count']}건"
+                for entity in issue_data['top_entities']
+            ]
+            print(f"주요 개체: {', '.join(top_entities)}")
+    
+    return issues
@@ -1,17 +1,29 @@
 import os
 import glob
+import hashlib
+from collections import Counter
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from src.models import NewsArticle
+from src.models import NewsArticle, IngestManifest
+from src.models.ingest_manifest import STATUS_IN_PROGRESS, STATUS_COMPLETED, STATUS_FAILED
 from src.utils.db_config import get_session, ensure_table_exists
+from src.utils.metrics import PipelineMetrics
+from src.utils.article_stats import increment_daily_counts
+from src.utils.entity_index import EntityIndexer
 
 class CSVProcessor:
     """CSV 파일 처리 클래스"""
     
-    def __init__(self):
+    def __init__(self, metrics=None):
+        """
+        Args:
+            metrics (PipelineMetrics): 단계별 측정 기록 (없으면 새로 생성)
+        """
         self.base_dir = os.path.dirname(os.path.abspath(__file__))
         self.data_dir = os.path.join(self.base_dir, 'data')
+        self.metrics = metrics if metrics is not None else PipelineMetrics('ingest')
+        self.entity_indexer = EntityIndexer()
     
     def convert_nan_to_empty(self, value):
         """NaN 값을 빈 문자열로 변환"""
@@ -19,28 +31,55 @@ class CSVProcessor:
             return ''
         return str(value)
     
-    def process_single_file(self, csv_path, session, existing_news_ids):
+    def compute_file_hash(self, path, chunk_size=1024 * 1024):
+        """파일 내용의 SHA-256 해시 계산"""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    def process_single_file(self, csv_path, session, existing_news_ids, manifest=None, start_row=0):
         """단일 CSV 파일 처리
         
         Args:
             csv_path (str): CSV 파일 경로
             session: DB 세션
             existing_news_ids (set): 기존 뉴스 ID 집합
+            manifest (IngestManifest): 적재 이력 (있으면 중간 저장 시 재시작 위치를 함께 커밋)
+            start_row (int): 처리를 시작할 행 번호 (이전에 커밋된 행은 건너뜀)
             
         Returns:
             tuple: (새로 저장된 기사 수, 건너뛴 기사 수, 오류 발생 여부)
         """
         print(f"\n처리 시작: {os.path.basename(csv_path)}")
         
+        # 개체 사전은 세션(DB)마다 다르므로 파일마다 현재 세션에서 다시 불러오기
+        self.entity_indexer.reset()
+        
         error_occurred = False
+        batch_news_ids = []  # 아직 커밋되지 않은 기사의 뉴스 ID (롤백 시 중복 집합에서 제거)
         
         try:
+            file_name = os.path.basename(csv_path)
+            
             # CSV 파일 읽기 - 뉴스 식별자를 문자열로 읽기
-            df = pd.read_csv(csv_path, dtype={'뉴스 식별자': str})
+            with self.metrics.stage('read_csv', file=file_name) as stage:
+                df = pd.read_csv(csv_path, dtype={'뉴스 식별자': str})
+                total_rows = len(df)
+                stage.items = total_rows
+                stage.extra['bytes'] = os.path.getsize(csv_path)
+            
+            # 이전 실행에서 커밋된 행은 건너뛰기 (행 번호는 원본 기준으로 유지)
+            if start_row > 0:
+                print(f"  이전 실행 이어서 처리: {start_row}/{total_rows} 행부터")
+                df = df.iloc[start_row:]
             
             # NaN 값을 빈 문자열로 변환
-            for column in df.columns:
-                df[column] = df[column].apply(self.convert_nan_to_empty)
+            with self.metrics.stage('clean', file=file_name) as stage:
+                for column in df.columns:
+                    df[column] = df[column].apply(self.convert_nan_to_empty)
+                stage.items = len(df)
             
             # 컬럼명 매핑
             column_mapping = {
@@ -65,67 +104,97 @@ class CSVProcessor:
             df = df.rename(columns=column_mapping)
             
             new_articles_count = 0
+            committed_new_count = 0  # 적재 이력에 이미 반영된 새 기사 수
+            pending_counts = Counter()  # 커밋 전 일자·카테고리·언론사별 기사 수
             skipped_count = 0
             duplicate_count = 0
             
             # DataFrame의 각 행을 DB에 저장
-            for idx, row in df.iterrows():
-                # 진행상황 표시 (1000개마다)
-                if idx > 0 and idx % 1000 == 0:
-                    print(f"  진행중: {idx}/{len(df)} 행 처리완료")
+            with self.metrics.stage('insert', file=file_name) as stage:
+                for idx, row in df.iterrows():
+                    # 진행상황 표시 (1000개마다)
+                    if idx > 0 and idx % 1000 == 0:
+                        print(f"  진행중: {idx}/{total_rows} 행 처리완료")
                     
-                try:
-                    # 날짜 처리
                     try:
-                        date = pd.to_datetime(row['date']).date()
-                    except:
-                        print(f"  날짜 변환 오류 (행 {idx}): {row['date']}")
-                        skipped_count += 1
-                        error_occurred = True
-                        continue
+                        # 날짜 처리
+                        try:
+                            date = pd.to_datetime(row['date']).date()
+                        except:
+                            print(f"  날짜 변환 오류 (행 {idx}): {row['date']}")
+                            skipped_count += 1
+                            error_occurred = True
+                            continue
                     
-                    # 뉴스 식별자가 이미 존재하는지 확인
-                    if str(row['news_id']) in existing_news_ids:
-                        duplicate_count += 1
-                        skipped_count += 1
-                        continue
+                        # 뉴스 식별자가 이미 존재하는지 확인
+                        if str(row['news_id']) in existing_news_ids:
+                            duplicate_count += 1
+                            skipped_count += 1
+                            continue
                     
-                    # 새 기사 객체 생성
-                    article = NewsArticle(
-                        news_id=str(row['news_id']),
-                        date=date,
-                        media=self.convert_nan_to_empty(row['media']),
-                        author=self.convert_nan_to_empty(row['author']),
-                        title=self.convert_nan_to_empty(row['title']),
-                        category1=self.convert_nan_to_empty(row['category1']),
-                        category2=self.convert_nan_to_empty(row['category2']),
-                        category3=self.convert_nan_to_empty(row['category3']),
-                        people=self.convert_nan_to_empty(row['people']),
-                        location=self.convert_nan_to_empty(row['location']),
-                        organization=self.convert_nan_to_empty(row['organization']),
-                        keywords=self.convert_nan_to_empty(row['keywords']),
-                        characteristics=self.convert_nan_to_empty(row['characteristics']),
-                        content=self.convert_nan_to_empty(row['content']),
-                        source=self.convert_nan_to_empty(row['source'])
-                    )
+                        # 새 기사 객체 생성
+                        article = NewsArticle(
+                            news_id=str(row['news_id']),
+                            date=date,
+                            media=self.convert_nan_to_empty(row['media']),
+                            author=self.convert_nan_to_empty(row['author']),
+                            title=self.convert_nan_to_empty(row['title']),
+                            category1=self.convert_nan_to_empty(row['category1']),
+                            category2=self.convert_nan_to_empty(row['category2']),
+                            category3=self.convert_nan_to_empty(row['category3']),
+                            people=self.convert_nan_to_empty(row['people']),
+                            location=self.convert_nan_to_empty(row['location']),
+                            organization=self.convert_nan_to_empty(row['organization']),
+                            keywords=self.convert_nan_to_empty(row['keywords']),
+                            characteristics=self.convert_nan_to_empty(row['characteristics']),
+                            content=self.convert_nan_to_empty(row['content']),
+                            source=self.convert_nan_to_empty(row['source'])
+                        )
                     
-                    session.add(article)
-                    new_articles_count += 1
-                    existing_news_ids.add(str(row['news_id']))
+                        session.add(article)
+                        pending_counts[(article.date, article.category1, article.media)] += 1
+                        self.entity_indexer.add(article.news_id, article.people, article.location, article.organization)
+                        new_articles_count += 1
+                        existing_news_ids.add(str(row['news_id']))
+                        batch_news_ids.append(str(row['news_id']))
                     
-                    # 1000개마다 커밋
-                    if new_articles_count % 1000 == 0:
-                        session.commit()
-                        print(f"  중간 저장 완료: {new_articles_count}개 저장")
+                        # 1000개마다 커밋
+                        if new_articles_count % 1000 == 0:
+                            # 재시작 위치를 같은 트랜잭션에서 기록
+                            if manifest is not None:
+                                manifest.rows_committed = idx + 1
+                                manifest.new_articles = (manifest.new_articles or 0) + new_articles_count - committed_new_count
+                            # 집계 테이블과 개체 역색인도 같은 트랜잭션에서 갱신
+                            increment_daily_counts(session, pending_counts)
+                            pending_counts.clear()
+                            self.entity_indexer.flush(session)
+                            session.commit()
+                            committed_new_count = new_articles_count
+                            batch_news_ids.clear()
+                            print(f"  중간 저장 완료: {new_articles_count}개 저장")
                         
-                except Exception as e:
-                    print(f"  오류 발생 (행 {idx}): {str(e)}")
-                    skipped_count += 1
-                    error_occurred = True
-                    continue
+                    except Exception as e:
+                        print(f"  오류 발생 (행 {idx}): {str(e)}")
+                        skipped_count += 1
+                        error_occurred = True
+                        continue
+            
+                # 마지막 커밋
+                if manifest is not None:
+                    manifest.rows_committed = total_rows
+                    manifest.total_rows = total_rows
+                    manifest.new_articles = (manifest.new_articles or 0) + new_articles_count - committed_new_count
+                    manifest.status = STATUS_COMPLETED
+                    manifest.updated_at = datetime.now()
+                increment_daily_counts(session, pending_counts)
+                pending_counts.clear()
+                self.entity_indexer.flush(session)
+                session.commit()
+                batch_news_ids.clear()
+                stage.items = len(df)
+                stage.extra['new_articles'] = new_articles_count
+                stage.extra['duplicates'] = duplicate_count
             
-            # 마지막 커밋
-            session.commit()
             print(f"파일 처리 완료: {os.path.basename(csv_path)}")
             print(f"  - 새로 저장된 기사: {new_articles_count}개")
             print(f"  - 중복된 기사: {duplicate_count}개")
@@ -136,13 +205,78 @@ class CSVProcessor:
             
         except Exception as e:
             print(f"파일 처리 중 오류 발생: {str(e)}")
+            session.rollback()
+            self.entity_indexer.reset()
+            # 롤백된 기사는 다시 적재할 수 있도록 중복 검사 대상에서 제외
+            existing_news_ids.difference_update(batch_news_ids)
+            if manifest is not None:
+                # 커밋된 재시작 위치는 유지하고 상태만 기록
+                manifest.status = STATUS_FAILED
+                manifest.updated_at = datetime.now()
+                session.commit()
             return 0, 0, True
     
-    def process_files(self, csv_pattern="*.csv"):
+    def prepare_manifest(self, csv_path, session, manifest_index, force=False):
+        """적재 이력을 확인하여 파일 처리 여부와 시작 위치 결정
+        
+        Args:
+            csv_path (str): CSV 파일 경로
+            session: DB 세션
+            manifest_index (dict): {파일 경로: (상태, 크기, 수정 시각)} 형태의 적재 이력 요약
+            force (bool): 적재 이력을 무시하고 처음부터 다시 처리
+            
+        Returns:
+            tuple: (적재 이력, 시작 행 번호), 건너뛸 파일이면 (None, None)
+        """
+        path = os.path.abspath(csv_path)
+        stat = os.stat(path)
+        
+        # 적재가 끝난 파일의 크기와 수정 시각이 같으면 파일을 열지 않고 건너뛰기
+        if not force and manifest_index.get(path) == (STATUS_COMPLETED, stat.st_size, stat.st_mtime):
+            return None, None
+        
+        with self.metrics.stage('hash', file=os.path.basename(path)) as stage:
+            content_hash = self.compute_file_hash(path)
+            stage.items = 1
+            stage.extra['bytes'] = stat.st_size
+        
+        start_row = 0
+        entry = session.get(IngestManifest, path) if path in manifest_index else None
+        if entry is None:
+            entry = IngestManifest(path=path, rows_committed=0, new_articles=0)
+            session.add(entry)
+        elif entry.content_hash == content_hash and not force:
+            if entry.status == STATUS_COMPLETED:
+                # 내용은 같고 수정 시각만 바뀐 경우
+                entry.size = stat.st_size
+                entry.mtime = stat.st_mtime
+                session.commit()
+                return None, None
+            # 중단된 파일은 마지막으로 커밋된 위치부터 이어서 처리
+            start_row = entry.rows_committed or 0
+        else:
+            # 내용이 바뀐 파일은 처음부터 다시 처리
+            entry.rows_committed = 0
+            entry.total_rows = None
+            entry.new_articles = 0
+        
+        entry.size = stat.st_size
+        entry.mtime = stat.st_mtime
+        entry.content_hash = content_hash
+        entry.status = STATUS_IN_PROGRESS
+        entry.updated_at = datetime.now()
+        session.commit()
+        return entry, start_row
+    
+    def process_files(self, csv_pattern="*.csv", force=False):
         """여러 CSV 파일을 읽어서 DB에 저장
         
+        적재 이력(ingest_manifest)에 완료로 기록된 파일 중 크기와 수정 시각이
+        같은 파일은 건너뛰고, 중단된 파일은 마지막으로 커밋된 위치부터 이어서 처리한다.
+        
         Args:
             csv_pattern (str): CSV 파일 패턴 (예: "*.csv", "news_*.csv" 등)
+            force (bool): 적재 이력을 무시하고 모든 파일을 다시 처리
         """
         # CSV 파일 목록 가져오기
         csv_pattern_path = os.path.join(self.data_dir, csv_pattern)
@@ -160,20 +294,49 @@ class CSVProcessor:
         session = get_session()
         
         try:
-            # 기존 뉴스 ID 조회
-            existing_news_ids = set(str(id_tuple[0]) for id_tuple in session.query(NewsArticle.news_id).all())
-            print(f"기존 DB에 저장된 기사 수: {len(existing_news_ids)}개")
+            # 적재 이력 조회
+            with self.metrics.stage('load_manifest') as stage:
+                manifest_index = {
+                    path: (status, size, mtime)
+                    for path, status, size, mtime in session.query(
+                        IngestManifest.path,
+                        IngestManifest.status,
+                        IngestManifest.size,
+                        IngestManifest.mtime
+                    )
+                }
+                stage.items = len(manifest_index)
+            
+            # 기존 뉴스 ID는 실제로 처리할 파일이 있을 때만 조회
+            existing_news_ids = None
             
             # 전체 처리 결과 집계
             total_new = 0
             total_skipped = 0
             error_files = []  # 예외가 발생한 파일
             skipped_files = []  # 건너뛴 기사나 중복이 있는 파일
+            unchanged_files = []  # 이미 적재가 끝나 건너뛴 파일
             
             # 각 CSV 파일 처리
             for csv_file in csv_files:
                 try:
-                    new_count, skipped_count, error_occurred = self.process_single_file(csv_file, session, existing_news_ids)
+                    manifest, start_row = self.prepare_manifest(csv_file, session, manifest_index, force)
+                    if manifest is None:
+                        unchanged_files.append(os.path.basename(csv_file))
+                        continue
+                    
+                    if existing_news_ids is None:
+                        # 기존 뉴스 ID 조회
+                        with self.metrics.stage('load_existing_ids') as stage:
+                            existing_news_ids = set(str(id_tuple[0]) for id_tuple in session.query(NewsArticle.news_id).all())
+                            stage.items = len(existing_news_ids)
+                        print(f"기존 DB에 저장된 기사 수: {len(existing_news_ids)}개")
+                    
+                    with self.metrics.stage('file', file=os.path.basename(csv_file)) as stage:
+                        new_count, skipped_count, error_occurred = self.process_single_file(
+                            csv_file, session, existing_news_ids, manifest=manifest, start_row=start_row
+                        )
+                        stage.items = new_count + skipped_count
                     total_new += new_count
                     total_skipped += skipped_count
                     
@@ -190,12 +353,15 @@ class CSVProcessor:
                         error_files.append(os.path.basename(csv_file))
                         
                 except Exception as e:
+                    session.rollback()
+                    self.entity_indexer.reset()
                     print(f"파일 처리 실패 ({os.path.basename(csv_file)}): {str(e)}")
                     error_files.append(os.path.basename(csv_file))
                     continue
             
             print("\n=== 전체 처리 결과 ===")
-            print(f"처리된 파일 수: {len(csv_files)}개")
+            print(f"처리된 파일 수: {len(csv_files) - len(unchanged_files)}개")
+            print(f"변경 없이 건너뛴 파일 수: {len(unchanged_files)}개")
             print(f"새로 저장된 총 기사 수: {total_new}개")
             print(f"건너뛴 총 기사 수: {total_skipped}개")
             
@@ -1 +1,5 @@
 from .news_article import NewsArticle
+from .ingest_manifest import IngestManifest
+from .article_daily_count import ArticleDailyCount
+from .entity import Entity, ArticleEntity
+from .derived_table_state import DerivedTableState
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, Date, Integer
+from .news_article import Base
+
+class ArticleDailyCount(Base):
+    """일자·카테고리·언론사별 기사 수 집계 모델 (적재 시 함께 갱신)"""
+    __tablename__ = 'article_daily_counts'
+
+    date = Column(Date, primary_key=True)
+    category1 = Column(String, primary_key=True)
+    media = Column(String, primary_key=True)
+    article_count = Column(Integer, nullable=False, default=0)
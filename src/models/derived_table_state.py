@@ -0,0 +1,12 @@
+from sqlalchemy import Column, String, DateTime
+from .news_article import Base
+
+class DerivedTableState(Base):
+    """기사 테이블에서 파생되는 테이블의 채우기 완료 기록 모델
+
+    행이 있으면 해당 테이블이 기존 기사로 모두 채워졌음을 뜻한다.
+    """
+    __tablename__ = 'derived_table_state'
+
+    name = Column(String, primary_key=True)
+    rebuilt_at = Column(DateTime, nullable=False)
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, String, Integer, ForeignKey, UniqueConstraint
+from .news_article import Base
+
+# 개체 종류와 news_articles 컬럼 매핑
+ENTITY_FIELDS = {
+    'person': 'people',
+    'location': 'location',
+    'organization': 'organization',
+}
+
+class Entity(Base):
+    """인물/위치/기관 개체 사전 모델"""
+    __tablename__ = 'entities'
+    __table_args__ = (UniqueConstraint('entity_type', 'name'),)
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    entity_type = Column(String, nullable=False)
+    name = Column(String, nullable=False)
+
+class ArticleEntity(Base):
+    """기사-개체 역색인(posting) 모델"""
+    __tablename__ = 'article_entities'
+
+    news_id = Column(String, ForeignKey('news_articles.news_id'), primary_key=True)
+    entity_id = Column(Integer, ForeignKey('entities.id'), primary_key=True, index=True)
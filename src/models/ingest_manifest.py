@@ -0,0 +1,21 @@
+from sqlalchemy import Column, String, Integer, BigInteger, Float, DateTime
+from .news_article import Base
+
+# 적재 상태
+STATUS_IN_PROGRESS = 'in_progress'
+STATUS_COMPLETED = 'completed'
+STATUS_FAILED = 'failed'
+
+class IngestManifest(Base):
+    """CSV 파일 적재 이력 모델"""
+    __tablename__ = 'ingest_manifest'
+
+    path = Column(String, primary_key=True)
+    size = Column(BigInteger, nullable=False)
+    mtime = Column(Float, nullable=False)
+    content_hash = Column(String, nullable=False)
+    status = Column(String, nullable=False)
+    rows_committed = Column(Integer, nullable=False, default=0)  # 커밋까지 완료된 행 수 (재시작 위치)
+    total_rows = Column(Integer)
+    new_articles = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime)
@@ -0,0 +1,94 @@
+from sqlalchemy import func, insert, delete
+from src.models import NewsArticle, ArticleDailyCount
+
+def increment_daily_counts(session, counts):
+    """집계 테이블에 기사 수 누적 (커밋은 호출하는 쪽에서 기사 저장과 함께 수행)
+
+    Args:
+        session: DB 세션
+        counts (Counter): {(일자, 카테고리1, 언론사): 기사 수}
+    """
+    if not counts:
+        return
+
+    # 배치에 포함된 날짜의 기존 집계를 한 번에 조회
+    dates = {date for date, _, _ in counts}
+    existing = {
+        (row.date, row.category1, row.media): row
+        for row in session.query(ArticleDailyCount).filter(ArticleDailyCount.date.in_(dates))
+    }
+
+    for (date, category1, media), count in counts.items():
+        key = (date, category1 or '', media or '')
+        row = existing.get(key)
+        if row is None:
+            row = ArticleDailyCount(date=key[0], category1=key[1], media=key[2], article_count=count)
+            session.add(row)
+            existing[key] = row
+        else:
+            row.article_count += count
+
+def rebuild_daily_counts(session):
+    """news_articles 테이블 전체로 집계 테이블 재생성 (커밋은 호출하는 쪽에서 수행)"""
+    session.execute(delete(ArticleDailyCount))
+    session.execute(
+        insert(ArticleDailyCount).from_select(
+            ['date', 'category1', 'media', 'article_count'],
+            session.query(
+                NewsArticle.date,
+                func.coalesce(NewsArticle.category1, ''),
+                func.coalesce(NewsArticle.media, ''),
+                func.count()
+            ).group_by(
+                NewsArticle.date,
+                func.coalesce(NewsArticle.category1, ''),
+                func.coalesce(NewsArticle.media, '')
+            )
+        )
+    )
+
+def _filter_window(query, start_date=None, end_date=None, categories=None, category_prefix=None):
+    """집계 테이블 조회에 기간/카테고리 조건 적용"""
+    if start_date is not None:
+        query = query.filter(ArticleDailyCount.date >= start_date)
+    if end_date is not None:
+        query = query.filter(ArticleDailyCount.date <= end_date)
+    if categories is not None:
+        query = query.filter(ArticleDailyCount.category1.in_(categories))
+    if category_prefix is not None:
+        query = query.filter(ArticleDailyCount.category1.startswith(category_prefix))
+    return query
+
+def count_articles(session, start_date=None, end_date=None, categories=None, category_prefix=None):
+    """집계 테이블로 조건에 맞는 기사 수 계산
+
+    Args:
+        session: DB 세션
+        start_date: 시작 날짜
+        end_date: 종료 날짜
+        categories (list): 카테고리1 목록
+        category_prefix (str): 카테고리1 접두어
+
+    Returns:
+        int: 기사 수
+    """
+    query = session.query(func.coalesce(func.sum(ArticleDailyCount.article_count), 0))
+    return int(_filter_window(query, start_date, end_date, categories, category_prefix).scalar())
+
+def get_count_stats(session, group_by='category1', start_date=None, end_date=None):
+    """집계 테이블로 그룹별 기사 수 조회
+
+    Args:
+        session: DB 세션
+        group_by (str): 'category1', 'media', 'date' 중 하나
+        start_date: 시작 날짜
+        end_date: 종료 날짜
+
+    Returns:
+        list: [(그룹 값, 기사 수)] (기사 수 내림차순, 날짜는 날짜순)
+    """
+    column = getattr(ArticleDailyCount, group_by)
+    total = func.sum(ArticleDailyCount.article_count)
+    query = _filter_window(session.query(column, total), start_date, end_date).group_by(column)
+    query = query.order_by(column) if group_by == 'date' else query.order_by(total.desc())
+    return [(value, int(count)) for value, count in query.all()]
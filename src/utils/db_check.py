@@ -1,3 +1,4 @@
+import argparse
 import sys
 import os
 
@@ -5,37 +6,33 @@ import os
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
 sys.path.insert(0, project_root)
 
-from src.utils.db_config import get_session
+from src.utils.db_config import get_session, ensure_table_exists, rebuild_derived_table, DERIVED_TABLES
+from src.utils.article_stats import count_articles, get_count_stats
 from src.models import NewsArticle
 from datetime import datetime
 
 def check_articles():
+    ensure_table_exists()
     session = get_session()
     try:
         # 2024년 1월 데이터 조회
         start_date = datetime(2024, 1, 1).date()
         end_date = datetime(2024, 1, 31).date()
         
-        # 전체 기사 수 확인
-        total_count = session.query(NewsArticle).count()
+        # 전체 기사 수 확인 (집계 테이블 사용)
+        total_count = count_articles(session)
         print(f"전체 기사 수: {total_count}")
         
         # 해당 기간 기사 수 확인
-        period_count = session.query(NewsArticle).filter(
-            NewsArticle.date.between(start_date, end_date)
-        ).count()
+        period_count = count_articles(session, start_date, end_date)
         print(f"\n2024년 1월 기사 수: {period_count}")
         
-        # 카테고리별 기사 수 확인
-        categories = session.query(NewsArticle.category1).distinct().all()
+        # 카테고리별 기사 수 확인 (해당 기간에 기사가 없는 카테고리도 0개로 표시)
         print("\n카테고리별 기사 수:")
-        for category in categories:
-            if category[0]:  # None이 아닌 경우만
-                count = session.query(NewsArticle).filter(
-                    NewsArticle.category1 == category[0],
-                    NewsArticle.date.between(start_date, end_date)
-                ).count()
-                print(f"{category[0]}: {count}개")
+        period_counts = dict(get_count_stats(session, 'category1', start_date, end_date))
+        for category, _ in get_count_stats(session, 'category1'):
+            if category:  # 빈 값이 아닌 경우만
+                print(f"{category}: {period_counts.get(category, 0)}개")
                 
         # 샘플 기사 확인
         print("\n샘플 기사:")
@@ -52,5 +49,68 @@ def check_articles():
     finally:
         session.close()
 
+def rebuild_tables(names=None):
+    """news_articles 테이블로 파생 테이블(집계 테이블, 개체 역색인) 재생성
+    
+    Args:
+        names (list): 재생성할 테이블 이름 (없으면 전체)
+    """
+    ensure_table_exists()
+    session = get_session()
+    try:
+        for name in names or DERIVED_TABLES:
+            rebuild_derived_table(session, name)
+            print(f"{name} 재생성 완료")
+    finally:
+        session.close()
+
+def show_stats(group_by='category1', start_date=None, end_date=None, rebuild=False):
+    """집계 테이블로 그룹별 기사 수 출력
+    
+    Args:
+        group_by (str): 'category1', 'media', 'date' 중 하나
+        start_date (str): 시작 날짜 (YYYY-MM-DD 형식)
+        end_date (str): 종료 날짜 (YYYY-MM-DD 형식)
+        rebuild (bool): news_articles 테이블로 집계 테이블을 다시 생성
+    """
+    ensure_table_exists()
+    session = get_session()
+    try:
+        if rebuild:
+            rebuild_derived_table(session, 'article_daily_counts')
+            print("집계 테이블 재생성 완료")
+        
+        start = datetime.strptime(start_date, '%Y-%m-%d').date() if start_date else None
+        end = datetime.strptime(end_date, '%Y-%m-%d').date() if end_date else None
+        
+        stats = get_count_stats(session, group_by, start, end)
+        print(f"\n=== {group_by}별 기사 수 ({start_date or '처음'} ~ {end_date or '끝'}) ===")
+        for value, count in stats:
+            print(f"{value or '(없음)'}: {count}개")
+        print(f"\n합계: {sum(count for _, count in stats)}개")
+    finally:
+        session.close()
+
 if __name__ == "__main__":
-    check_articles()
+    parser = argparse.ArgumentParser(description='DB 상태 확인')
+    subparsers = parser.add_subparsers(dest='command', help='수행할 작업')
+    
+    # 집계 테이블 기반 통계 명령어
+    stats_parser = subparsers.add_parser('stats', help='일자·카테고리·언론사별 기사 수 (집계 테이블)')
+    stats_parser.add_argument('--by', default='category1', choices=['category1', 'media', 'date'], help='집계 기준')
+    stats_parser.add_argument('--start-date', help='시작 날짜 (YYYY-MM-DD)')
+    stats_parser.add_argument('--end-date', help='종료 날짜 (YYYY-MM-DD)')
+    stats_parser.add_argument('--rebuild', action='store_true', help='집계 테이블 재생성')
+    
+    # 파생 테이블 재생성 명령어
+    rebuild_parser = subparsers.add_parser('rebuild', help='news_articles 테이블로 집계 테이블/개체 역색인 재생성')
+    rebuild_parser.add_argument('--table', action='append', choices=list(DERIVED_TABLES), help='재생성할 테이블 (여러 번 지정 가능, 생략 시 전체)')
+    
+    args = parser.parse_args()
+    
+    if args.command == 'stats':
+        show_stats(args.by, args.start_date, args.end_date, args.rebuild)
+    elif args.command == 'rebuild':
+        rebuild_tables(args.table)
+    else:
+        check_articles()
@@ -1,6 +1,10 @@
 from sqlalchemy import create_engine, inspect
 from sqlalchemy.orm import sessionmaker
 from src.models.news_article import Base
+from src.models.derived_table_state import DerivedTableState
+from src.utils.article_stats import rebuild_daily_counts
+from src.utils.entity_index import rebuild_entity_index
+from datetime import datetime
 import os
 
 # 프로젝트 루트 디렉토리 설정
@@ -9,20 +13,73 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__fil
 # SQLite DB 파일 경로 설정
 DB_PATH = os.path.join(BASE_DIR, 'data', 'news.db')
 
-# DB 파일이 저장될 디렉토리가 없으면 생성
-os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-
 # SQLite DB 연결 설정
 DATABASE_URL = f"sqlite:///{DB_PATH}"
-engine = create_engine(DATABASE_URL)
+
+# 엔진과 세션 팩토리는 처음 사용할 때 생성 (import 시 부수효과 방지)
+_engine = None
+_Session = None
+
+def get_engine():
+    """데이터베이스 엔진 반환 (최초 호출 시 생성)"""
+    global _engine
+    if _engine is None:
+        # DB 파일이 저장될 디렉토리가 없으면 생성
+        os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+        _engine = create_engine(DATABASE_URL)
+    return _engine
 
 def get_session():
     """데이터베이스 세션 생성"""
-    Session = sessionmaker(bind=engine)
-    return Session()
+    global _Session
+    if _Session is None:
+        _Session = sessionmaker(bind=get_engine())
+    return _Session()
+
+# 기사 테이블에서 파생되는 테이블과 재생성 함수
+DERIVED_TABLES = {
+    'article_daily_counts': rebuild_daily_counts,
+    'article_entities': rebuild_entity_index,
+}
+
+def rebuild_derived_table(session, name):
+    """파생 테이블을 기사 테이블로 다시 채우고 완료 기록을 남김
+
+    재생성과 완료 기록을 한 트랜잭션으로 커밋하므로, 중간에 중단되면
+    완료 기록이 남지 않아 다음 실행에서 처음부터 다시 채운다.
+
+    Args:
+        session: DB 세션
+        name (str): DERIVED_TABLES에 등록된 테이블 이름
+    """
+    try:
+        DERIVED_TABLES[name](session)
+        session.merge(DerivedTableState(name=name, rebuilt_at=datetime.now()))
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
 
 def ensure_table_exists():
-    """테이블이 없을 경우에만 생성"""
+    """테이블이 없을 경우에만 생성 (기존 DB에 새로 추가된 테이블 포함)
+
+    파생 테이블은 완료 기록이 없거나 테이블이 없으면 기존 기사로 다시 채운다.
+    """
+    engine = get_engine()
     inspector = inspect(engine)
-    if not inspector.has_table('news_articles'):
-        Base.metadata.create_all(engine)
+    missing = {name for name in DERIVED_TABLES if not inspector.has_table(name)}
+    Base.metadata.create_all(engine)
+
+    session = get_session()
+    try:
+        # 테이블이 새로 생긴 경우 이전 완료 기록은 무효
+        if missing:
+            session.query(DerivedTableState).filter(DerivedTableState.name.in_(missing)).delete()
+            session.commit()
+        completed = {name for name, in session.query(DerivedTableState.name)}
+        for name in DERIVED_TABLES:
+            if name not in completed:
+                print(f"파생 테이블 채우는 중: {name}")
+                rebuild_derived_table(session, name)
+    finally:
+        session.close()
@@ -0,0 +1,116 @@
+from sqlalchemy import insert, delete
+from src.models import NewsArticle, Entity, ArticleEntity
+from src.models.entity import ENTITY_FIELDS
+
+def split_entities(value):
+    """쉼표로 구분된 개체 문자열을 이름 리스트로 변환 (공백 제거, 중복 제거)"""
+    if not value:
+        return []
+    names = (name.strip() for name in str(value).split(','))
+    return list(dict.fromkeys(name for name in names if name))
+
+class EntityIndexer:
+    """기사의 인물/위치/기관 필드를 개체 사전과 역색인 테이블에 반영하는 클래스
+
+    기사를 add로 모아 두었다가 flush에서 새 개체를 사전에 추가하고
+    역색인을 한 번에 저장한다. 커밋은 호출하는 쪽에서 기사 저장과 함께 수행한다.
+    """
+
+    def __init__(self):
+        self.entity_ids = None  # {(개체 종류, 이름): 개체 ID}
+        self.pending = []  # [(뉴스 ID, (개체 종류, 이름))]
+
+    def load(self, session):
+        """개체 사전 불러오기"""
+        self.entity_ids = {
+            (entity_type, name): entity_id
+            for entity_id, entity_type, name in session.query(Entity.id, Entity.entity_type, Entity.name)
+        }
+
+    def reset(self):
+        """롤백 후 호출: 저장되지 않은 개체가 남지 않도록 사전을 다시 불러오게 함"""
+        self.entity_ids = None
+        self.pending = []
+
+    def add(self, news_id, people, location, organization):
+        """기사 하나의 개체 필드 추가"""
+        values = {'person': people, 'location': location, 'organization': organization}
+        for entity_type in ENTITY_FIELDS:
+            for name in split_entities(values[entity_type]):
+                self.pending.append((news_id, (entity_type, name)))
+
+    def flush(self, session):
+        """모아 둔 개체와 역색인을 현재 트랜잭션에 저장"""
+        if not self.pending:
+            return
+        if self.entity_ids is None:
+            self.load(session)
+
+        # 사전에 없는 개체 추가 (flush로 ID 확보, 기사도 함께 flush됨)
+        new_keys = [key for key in dict.fromkeys(key for _, key in self.pending) if key not in self.entity_ids]
+        new_entities = [Entity(entity_type=entity_type, name=name) for entity_type, name in new_keys]
+        session.add_all(new_entities)
+        session.flush()
+        for entity in new_entities:
+            self.entity_ids[(entity.entity_type, entity.name)] = entity.id
+
+        session.execute(
+            insert(ArticleEntity),
+            [
+                {'news_id': news_id, 'entity_id': self.entity_ids[key]}
+                for news_id, key in dict.fromkeys(self.pending)
+            ]
+        )
+        self.pending = []
+
+def rebuild_entity_index(session, batch_size=5000):
+    """news_articles 테이블 전체로 개체 사전과 역색인 재생성
+
+    배치마다 flush만 하고 커밋은 호출하는 쪽에서 한 번에 수행하므로,
+    중간에 중단되면 기존 사전과 역색인이 그대로 남는다.
+    """
+    session.execute(delete(ArticleEntity))
+    session.execute(delete(Entity))
+
+    indexer = EntityIndexer()
+    indexer.load(session)
+    last_news_id = None
+    while True:
+        query = session.query(
+            NewsArticle.news_id,
+            NewsArticle.people,
+            NewsArticle.location,
+            NewsArticle.organization
+        ).order_by(NewsArticle.news_id)
+        if last_news_id is not None:
+            query = query.filter(NewsArticle.news_id > last_news_id)
+        rows = query.limit(batch_size).all()
+        if not rows:
+            break
+
+        for news_id, people, location, organization in rows:
+            indexer.add(news_id, people, location, organization)
+        indexer.flush(session)
+        last_news_id = rows[-1].news_id
+
+def resolve_entity_ids(session, entities):
+    """개체 필터를 개체 ID 목록으로 변환
+
+    Args:
+        session: DB 세션
+        entities (dict): {개체 종류: [이름 리스트]}
+
+    Returns:
+        list: 개체 ID 리스트 (사전에 없는 개체가 있으면 None)
+    """
+    entity_ids = []
+    for entity_type, names in (entities or {}).items():
+        for name in names or []:
+            entity_id = session.query(Entity.id).filter(
+                Entity.entity_type == entity_type,
+                Entity.name == name
+            ).scalar()
+            if entity_id is None:
+                return None
+            entity_ids.append(entity_id)
+    return entity_ids
@@ -0,0 +1,154 @@
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Linux에서는 /proc/self/clear_refs에 5를 쓰면 최대 RSS(VmHWM)가 초기화되어
+# 단계별 최대 메모리를 따로 측정할 수 있다
+_PROC_STATUS = '/proc/self/status'
+_PROC_CLEAR_REFS = '/proc/self/clear_refs'
+
+def _read_peak_rss_kb():
+    """현재 프로세스의 최대 RSS (KB, 측정 불가 시 None)"""
+    try:
+        with open(_PROC_STATUS) as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    if resource is not None:
+        # Linux는 KB, macOS는 바이트 단위
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == 'darwin' else peak
+    return None
+
+def _reset_peak_rss():
+    """최대 RSS 초기화 (성공 시 True)"""
+    try:
+        with open(_PROC_CLEAR_REFS, 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+class StageMetrics:
+    """단일 처리 단계의 측정 결과
+
+    Attributes:
+        name (str): 단계 이름
+        items (int): 처리한 항목 수 (단계 안에서 설정)
+        extra (dict): 단계별 추가 정보 (파일명, 어휘 수 등)
+        wall_time (float): 경과 시간 (초)
+        cpu_time (float): 프로세스 CPU 시간 (초)
+        peak_rss_mb (float): 단계 중 최대 RSS (MB)
+        peak_rss_scope (str): 'stage'면 단계별 최대값, 'process'면 프로세스 시작 이후 최대값
+        status (str): 'ok' 또는 'failed'
+    """
+
+    def __init__(self, name, depth=0, **extra):
+        self.name = name
+        self.depth = depth
+        self.items = None
+        self.extra = extra
+        self.wall_time = None
+        self.cpu_time = None
+        self.peak_rss_mb = None
+        self.peak_rss_scope = None
+        self.status = 'ok'
+        self._peak_rss_kb = 0
+
+    def to_dict(self):
+        record = {
+            'stage': self.name,
+            'depth': self.depth,
+            'status': self.status,
+            'items': self.items,
+            'wall_time': round(self.wall_time, 6) if self.wall_time is not None else None,
+            'cpu_time': round(self.cpu_time, 6) if self.cpu_time is not None else None,
+            'peak_rss_mb': self.peak_rss_mb,
+            'peak_rss_scope': self.peak_rss_scope,
+        }
+        record.update(self.extra)
+        return record
+
+class PipelineMetrics:
+    """파이프라인 단계별 시간/메모리/처리량 기록 클래스
+
+    사용 예:
+        metrics = PipelineMetrics('extract')
+        with metrics.stage('tfidf') as stage:
+            matrix = vectorizer.fit_transform(texts)
+            stage.items = matrix.shape[0]
+        metrics.emit()
+    """
+
+    def __init__(self, pipeline):
+        self.pipeline = pipeline
+        self.started_at = datetime.now()
+        self.stages = []
+        self._active = []
+
+    @contextmanager
+    def stage(self, name, **extra):
+        """단계 측정 컨텍스트 (중첩 가능)"""
+        record = StageMetrics(name, depth=len(self._active), **extra)
+        self.stages.append(record)
+
+        # 상위 단계의 최대 RSS를 보존한 뒤 초기화
+        if self._active:
+            parent = self._active[-1]
+            parent._peak_rss_kb = max(parent._peak_rss_kb, _read_peak_rss_kb() or 0)
+        record.peak_rss_scope = 'stage' if _reset_peak_rss() else 'process'
+        self._active.append(record)
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield record
+        except BaseException:
+            record.status = 'failed'
+            raise
+        finally:
+            record.wall_time = time.perf_counter() - wall_start
+            record.cpu_time = time.process_time() - cpu_start
+            self._active.pop()
+
+            peak_kb = _read_peak_rss_kb()
+            if peak_kb is not None:
+                record._peak_rss_kb = max(record._peak_rss_kb, peak_kb)
+                record.peak_rss_mb = round(record._peak_rss_kb / 1024, 1)
+                if self._active:
+                    parent = self._active[-1]
+                    parent._peak_rss_kb = max(parent._peak_rss_kb, record._peak_rss_kb)
+
+    def to_dict(self):
+        return {
+            'event': 'pipeline_metrics',
+            'pipeline': self.pipeline,
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'pid': os.getpid(),
+            'stages': [record.to_dict() for record in self.stages],
+        }
+
+    def to_json(self):
+        return json.dumps(self.to_dict(), ensure_ascii=False)
+
+    def emit(self, path=None):
+        """측정 결과를 JSON 한 줄로 출력
+
+        Args:
+            path (str): 지정하면 해당 파일에 JSON Lines 형식으로 추가, 없으면 표준 출력
+        """
+        if path:
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(self.to_json() + '\n')
+        else:
+            print(self.to_json())